@@ -2,43 +2,126 @@ import os
 import sys
 import json
 import argparse
-import tempfile
-import pickle
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Tuple, Iterable, Iterator
+import re
 
-# PDF and text processing
-from PyPDF2 import PdfReader
-from langchain.text_splitter import RecursiveCharacterTextSplitter
+# Everything else, including heavier stdlib modules such as asyncio, is imported
+# where it is used so that --help and argument errors return immediately
+if TYPE_CHECKING:
+    import sqlite3
 
-# Google Gemini and LangChain
-import google.generativeai as genai
-from langchain_google_genai import GoogleGenerativeAIEmbeddings, ChatGoogleGenerativeAI
-from langchain_community.vectorstores import FAISS
-from langchain.chains.question_answering import load_qa_chain
-from langchain.prompts import PromptTemplate
-from langchain.schema import Document
+EMBEDDING_MODEL = "models/embedding-001"
+# Persistent embedding cache, one SQLite file per embedding model
+EMBEDDING_CACHE_DIR = Path.home() / '.cache' / 'readme_gen_embeddings'
 
-# Environment
-from dotenv import load_dotenv
-import re
+# Text chunking, in tokens; Gemini embeddings truncate input past 2048 tokens
+CHUNK_SIZE_TOKENS = 1800
+CHUNK_OVERLAP_TOKENS = 200
+# Character-based fallback when the tiktoken encoding can't be loaded (~4 chars per token)
+CHUNK_SIZE_CHARS = CHUNK_SIZE_TOKENS * 4
+CHUNK_OVERLAP_CHARS = CHUNK_OVERLAP_TOKENS * 4
+# Pages split together per step, so embedding can start before splitting finishes
+PAGES_PER_SPLIT = 10
+
+# Gemini's batchEmbedContents accepts at most 100 inputs per request
+EMBEDDING_BATCH_SIZE = 100
+# Number of embedding batches allowed in flight at once
+EMBEDDING_CONCURRENCY = 6
+# PDFs with more pages than this are extracted on a thread pool
+PARALLEL_PDF_PAGE_THRESHOLD = 4
+
+# Start of each "--- Page N ---" section written by extract_text_from_pdf
+_PAGE_MARKER_RE = re.compile(r'(?=\n--- Page \d+ ---\n)')
+
+# README post-processing patterns
+_HEADER_RE = re.compile(r'\n(#{1,6})\s*([^\n]+)\n')
+_MULTINL_RE = re.compile(r'\n{3,}')
+_CODEBLOCK_RE = re.compile(r'```(\w+)?\n(.*?)\n```', re.DOTALL)
+# Paragraph breaks where streamed README text can be post-processed independently
+_STREAM_CUT_RE = re.compile(r'\n\n(?=[^\s#])')
+# A line of only '#'s, which _HEADER_RE could match across a following paragraph break
+_BARE_HEADER_RE = re.compile(r'#+')
+
+def _api_error(error: BaseException) -> BaseException:
+    """Return the underlying Google API error; langchain-google-genai re-raises it as the cause"""
+    return error.__cause__ if error.__cause__ is not None else error
+
+def _is_retryable_embedding_error(error: BaseException) -> bool:
+    """True for rate limits (429) and unavailability (503), raised directly or as the cause"""
+    from google.api_core.exceptions import ResourceExhausted, ServiceUnavailable
+    
+    return isinstance(_api_error(error), (ResourceExhausted, ServiceUnavailable))
+
+def _wait_retry_after(retry_state) -> float:
+    """Honor the server-provided RetryInfo delay when present, else back off exponentially"""
+    from tenacity import wait_exponential
+    
+    error = _api_error(retry_state.outcome.exception())
+    for detail in getattr(error, 'details', None) or []:
+        retry_delay = getattr(detail, 'retry_delay', None)  # google.rpc.RetryInfo
+        if retry_delay is not None:
+            seconds = retry_delay.seconds + retry_delay.nanos / 1e9
+            return min(max(seconds, 0.0), 30.0)
+    return wait_exponential(multiplier=1, max=30)(retry_state)
+
+class _ReadmeStreamFormatter:
+    """Emit post-processed README text incrementally while the raw text streams in"""
+    
+    def __init__(self, post_process):
+        self.post_process = post_process
+        self.raw = ""
+        self.emitted = ""
+    
+    def _safe_cut(self, text: str) -> Optional[int]:
+        """Last paragraph break that no post-processing pattern can match across"""
+        for match in reversed(list(_STREAM_CUT_RE.finditer(text))):
+            head = text[:match.end()].strip()
+            # The title fix-up needs the first line complete and not the last one stripped
+            if '\n' not in head:
+                return None
+            # A bare '#' line before the break would let the header pattern span it
+            if not _BARE_HEADER_RE.fullmatch(head.rsplit('\n', 1)[-1]):
+                return match.end()
+        return None
+    
+    def feed(self, chunk: str) -> str:
+        """Add raw text and return newly finalized formatted output"""
+        self.raw += chunk
+        text = self.raw.lstrip()
+        cut = self._safe_cut(text)
+        if cut is None:
+            return ""
+        formatted = self.post_process(text[:cut])
+        delta = formatted[len(self.emitted):]
+        self.emitted = formatted
+        return delta
+    
+    def finish(self) -> str:
+        """Return the remaining formatted output once the stream has ended"""
+        return self.post_process(self.raw.strip())[len(self.emitted):]
 
 class AdvancedReadmeGenerator:
-    def __init__(self, verbose=True):
+    def __init__(self, verbose=True, stream_output=False, log_to_stderr=False):
         """Initialize the advanced README generator with RAG capabilities"""
         self.verbose = verbose  # Control logging output
+        self.log_to_stderr = log_to_stderr  # Keep stdout free for results
+        self.stream_output = stream_output  # Write README to stdout as it is generated
         self.vector_store = None
         self.embeddings = None
+        self.query_embeddings: Dict[str, List[float]] = {}  # Reused across PDFs
         self.load_environment()
         self.setup_gemini()
         
     def log(self, message):
         """Print message only if verbose mode is enabled"""
         if self.verbose:
-            print(message)
+            print(message, file=sys.stderr if self.log_to_stderr else sys.stdout)
         
     def load_environment(self):
         """Load environment variables from .env file or system"""
+        from dotenv import load_dotenv
+        
         # First try to load from script directory (extension folder)
         script_dir = Path(__file__).parent
         env_file = script_dir / '.env'
@@ -65,13 +148,16 @@ class AdvancedReadmeGenerator:
     
     def setup_gemini(self):
         """Configure Gemini API and embeddings"""
+        import google.generativeai as genai
+        from langchain_google_genai import GoogleGenerativeAIEmbeddings, ChatGoogleGenerativeAI
+        
         try:
             # Configure the main Gemini API
             genai.configure(api_key=self.api_key)
             
             # Initialize embeddings with explicit API key and proper configuration
             self.embeddings = GoogleGenerativeAIEmbeddings(
-                model="models/embedding-001",
+                model=EMBEDDING_MODEL,
                 google_api_key=self.api_key
             )
             
@@ -84,63 +170,282 @@ class AdvancedReadmeGenerator:
             
             self.log("✅ Gemini API and embeddings configured successfully")
             
-            # Test the embeddings to make sure they work
-            try:
-                test_embedding = self.embeddings.embed_query("test")
-                if test_embedding and len(test_embedding) > 0:
-                    self.log("Embeddings test successful")
-                else:
-                    raise Exception("Embeddings test returned empty result")
-            except Exception as e:
-                self.log(f"Embeddings test failed: {e}")
-                raise Exception(f"Embeddings initialization failed: {e}")
+            # Sanity-check the embeddings object locally; the first real
+            # embedding request will surface any API key or quota problems
+            if not hasattr(self.embeddings, 'embed_documents'):
+                raise Exception("Embeddings initialization failed: 'embed_documents' method not found")
                 
         except Exception as e:
             raise Exception(f"Failed to configure Gemini API: {str(e)}")
     
+    def _extract_pages_pdfium(self, pdf_path: str) -> List[str]:
+        """Extract per-page text with pypdfium2"""
+        import pypdfium2 as pdfium  # Native PDFium backend, much faster than PyPDF2
+        
+        page_texts = []
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            # PDFium is not thread-safe, so pages are read sequentially
+            for page_num in range(len(pdf)):
+                try:
+                    page = pdf[page_num]
+                    try:
+                        textpage = page.get_textpage()
+                        try:
+                            page_texts.append(textpage.get_text_range())
+                        finally:
+                            textpage.close()
+                    finally:
+                        # Release native handles even when extraction fails
+                        page.close()
+                except Exception as e:
+                    self.log(f"⚠️ Warning: Could not extract text from page {page_num + 1}: {e}")
+                    page_texts.append("")
+        finally:
+            pdf.close()
+        return page_texts
+    
+    def _extract_pages_pypdf2(self, pdf_path: str) -> List[str]:
+        """Extract per-page text with PyPDF2"""
+        import io
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        from PyPDF2 import PdfReader
+        
+        with open(pdf_path, 'rb') as file:
+            data = file.read()
+        page_count = len(PdfReader(io.BytesIO(data)).pages)
+        
+        # PdfReader loads objects lazily by seeking its stream, so a shared
+        # reader races across threads; each worker gets its own reader
+        local = threading.local()
+        
+        def extract_page(page_num: int) -> str:
+            try:
+                if not hasattr(local, 'reader'):
+                    local.reader = PdfReader(io.BytesIO(data))
+                return local.reader.pages[page_num].extract_text() or ""
+            except Exception as e:
+                self.log(f"⚠️ Warning: Could not extract text from page {page_num + 1}: {e}")
+                return ""
+        
+        # Pages are independent, so large PDFs are decoded concurrently
+        if page_count > PARALLEL_PDF_PAGE_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                return list(executor.map(extract_page, range(page_count)))
+        return [extract_page(page_num) for page_num in range(page_count)]
+    
     def extract_text_from_pdf(self, pdf_path: str) -> str:
-        """Extract text content from PDF file using PyPDF2"""
+        """Extract text content from PDF file using pypdfium2, falling back to PyPDF2"""
         try:
             self.log(f"📄 Reading PDF: {pdf_path}")
-            text = ""
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PdfReader(file)
-                
-                for page_num, page in enumerate(pdf_reader.pages):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text.strip():  # Only add non-empty pages
-                            text += f"\n--- Page {page_num + 1} ---\n{page_text}\n"
-                    except Exception as e:
-                        self.log(f"⚠️ Warning: Could not extract text from page {page_num + 1}: {e}")
-                        continue
-                
-                if not text.strip():
-                    raise Exception("No text could be extracted from the PDF")
-                
-                self.log(f"✅ Extracted {len(text)} characters from PDF ({len(pdf_reader.pages)} pages)")
-                return text
+            try:
+                page_texts = self._extract_pages_pdfium(pdf_path)
+            except ImportError:
+                page_texts = self._extract_pages_pypdf2(pdf_path)
+            
+            # Collect page sections and join once; repeated += is quadratic on large PDFs
+            parts: List[str] = []
+            for page_num, page_text in enumerate(page_texts):
+                if page_text.strip():  # Only add non-empty pages
+                    parts.append(f"\n--- Page {page_num + 1} ---\n{page_text}\n")
+            text = "".join(parts)
+            
+            if not text.strip():
+                raise Exception("No text could be extracted from the PDF")
+            
+            self.log(f"✅ Extracted {len(text)} characters from PDF ({len(page_texts)} pages)")
+            return text
                 
         except FileNotFoundError:
             raise Exception(f"PDF file not found: {pdf_path}")
         except Exception as e:
             raise Exception(f"Error reading PDF: {str(e)}")
     
-    def get_text_chunks(self, text: str) -> List[str]:
-        """Split text into manageable chunks for vector processing"""
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=10000,  # Larger chunks for code context
-            chunk_overlap=1000,  # Overlap to maintain context
-            length_function=len,
-            separators=["\n\n", "\n", "File:", "---", " ", ""]  # Code-aware separators
-        )
+    def iter_text_chunks(self, text: str) -> Iterator[str]:
+        """Lazily split text into chunks, a group of pages at a time"""
+        from langchain.text_splitter import RecursiveCharacterTextSplitter
+        
+        separators = ["\n\n", "\n", "File:", "---", " ", ""]  # Code-aware separators
+        
+        # Measure chunks in tokens so they stay under the embedding model's input limit.
+        # tiktoken downloads the encoding on first use, so offline runs fall back to characters
+        try:
+            text_splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+                encoding_name="cl100k_base",
+                chunk_size=CHUNK_SIZE_TOKENS,
+                chunk_overlap=CHUNK_OVERLAP_TOKENS,
+                separators=separators
+            )
+        except Exception as e:
+            self.log(f"⚠️ Warning: Token-based splitting unavailable ({e}), splitting by characters")
+            text_splitter = RecursiveCharacterTextSplitter(
+                chunk_size=CHUNK_SIZE_CHARS,
+                chunk_overlap=CHUNK_OVERLAP_CHARS,
+                length_function=len,
+                separators=separators
+            )
+        
+        pages = [page for page in _PAGE_MARKER_RE.split(text) if page.strip()]
+        for start in range(0, len(pages), PAGES_PER_SPLIT):
+            yield from text_splitter.split_text("".join(pages[start:start + PAGES_PER_SPLIT]))
+    
+    async def _embed_with_retry(self, batch: List[str]) -> List[List[float]]:
+        """Embed a single batch, retrying only this batch on rate limits or 5xx"""
+        from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt
         
-        chunks = text_splitter.split_text(text)
-        self.log(f"📊 Created {len(chunks)} text chunks for processing")
-        return chunks
+        async for attempt in AsyncRetrying(
+            wait=_wait_retry_after,
+            stop=stop_after_attempt(5),
+            retry=retry_if_exception(_is_retryable_embedding_error),
+            reraise=True
+        ):
+            with attempt:
+                return await self.embeddings.aembed_documents(batch)
     
-    def create_vector_store(self, text_chunks: List[str]) -> bool:
+    def _open_embedding_cache(self) -> Optional["sqlite3.Connection"]:
+        """Open the on-disk embedding cache, or return None if it is unavailable"""
+        import sqlite3
+        
+        try:
+            EMBEDDING_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_file = EMBEDDING_CACHE_DIR / f"{EMBEDDING_MODEL.split('/')[-1]}.sqlite3"
+            conn = sqlite3.connect(cache_file)
+            conn.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector TEXT NOT NULL)")
+            return conn
+        except Exception as e:
+            self.log(f"⚠️ Warning: Embedding cache unavailable: {e}")
+            return None
+    
+    async def _aembed_stream(self, chunks: Iterable[str], conn: Optional["sqlite3.Connection"]):
+        """Embed chunks while they are still being produced, EMBEDDING_BATCH_SIZE at a time"""
+        import asyncio
+        import hashlib
+        import random
+        import threading
+        
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+        stop = threading.Event()
+        
+        def produce():
+            # Runs on a worker thread so splitting overlaps with embedding requests
+            try:
+                for chunk in chunks:
+                    if stop.is_set():
+                        break
+                    loop.call_soon_threadsafe(queue.put_nowait, chunk)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, done)
+        
+        producer = loop.run_in_executor(None, produce)
+        semaphore = asyncio.Semaphore(EMBEDDING_CONCURRENCY)
+        texts: List[str] = []
+        keys: List[str] = []
+        cached: Dict[str, List[float]] = {}
+        new_vectors: Dict[str, List[float]] = {}
+        pending: Dict[str, str] = {}  # key -> text awaiting the next batch
+        seen = set()
+        tasks = []
+        errors: List[BaseException] = []
+        
+        async def embed_batch(batch: Dict[str, str]):
+            try:
+                async with semaphore:
+                    if errors:
+                        return  # A sibling batch already failed; don't spend more quota
+                    # Small jitter so batches don't hit the API in lockstep
+                    await asyncio.sleep(random.random() * 0.05)
+                    batch_vectors = await self._embed_with_retry(list(batch.values()))
+            except Exception as e:
+                errors.append(e)
+                queue.put_nowait(done)  # Wake the consumer so it stops dispatching
+                return
+            new_vectors.update(zip(batch.keys(), batch_vectors))
+            
+            # Cache each batch as it completes so a later failure doesn't discard it
+            if conn is not None:
+                try:
+                    with conn:
+                        conn.executemany(
+                            "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                            [(key, json.dumps(vector)) for key, vector in zip(batch.keys(), batch_vectors)]
+                        )
+                except Exception as e:
+                    self.log(f"⚠️ Warning: Could not write embedding cache: {e}")
+        
+        try:
+            while not errors:
+                chunk = await queue.get()
+                if chunk is done:
+                    break
+                key = hashlib.sha256(chunk.encode('utf-8')).hexdigest()
+                texts.append(chunk)
+                keys.append(key)
+                
+                # Identical chunks (license headers, boilerplate) are embedded only once
+                if key in seen:
+                    continue
+                seen.add(key)
+                
+                vector = None
+                if conn is not None:
+                    try:
+                        row = conn.execute("SELECT vector FROM embeddings WHERE key = ?", (key,)).fetchone()
+                        vector = json.loads(row[0]) if row else None
+                    except Exception as e:
+                        # A locked, corrupt or stale cache only costs a re-embed
+                        self.log(f"⚠️ Warning: Could not read embedding cache: {e}")
+                if vector is not None:
+                    cached[key] = vector
+                    continue
+                
+                pending[key] = chunk
+                if len(pending) >= EMBEDDING_BATCH_SIZE:
+                    tasks.append(asyncio.create_task(embed_batch(pending)))
+                    pending = {}
+                
+            if not errors:
+                # Surface a splitting error before spending quota on the trailing batch
+                await producer
+                if pending:
+                    tasks.append(asyncio.create_task(embed_batch(pending)))
+            await asyncio.gather(*tasks)
+        finally:
+            # Stop the splitter thread and any queued batches on every exit path
+            stop.set()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await asyncio.wait([producer])
+            producer.exception()  # Retrieved so a secondary splitting error isn't reported as unhandled
+        if errors:
+            raise errors[0]
+        
+        self.log(f"💾 {len(texts) - len(new_vectors)} chunks reused from cache or duplicates, {len(new_vectors)} embedded in {len(tasks)} batch(es)")
+        return texts, keys, cached, new_vectors
+    
+    def embed_chunks(self, chunks: Iterable[str]) -> Tuple[List[str], List[List[float]]]:
+        """Embed chunks, reusing cached vectors and only sending unseen chunks to the API"""
+        import asyncio
+        
+        conn = self._open_embedding_cache()
+        try:
+            # Embed in concurrent batches so network round-trips overlap;
+            # each batch retries independently on rate limits
+            texts, keys, cached, new_vectors = asyncio.run(self._aembed_stream(chunks, conn))
+        finally:
+            if conn is not None:
+                conn.close()
+        
+        cached.update(new_vectors)
+        return texts, [cached[key] for key in keys]
+    
+    def create_vector_store(self, text_chunks: Iterable[str]) -> bool:
         """Create FAISS vector store from text chunks"""
+        from langchain_community.vectorstores import FAISS
+        
         try:
             self.log("🔍 Creating vector embeddings...")
             
@@ -152,37 +457,20 @@ class AdvancedReadmeGenerator:
             if self.embeddings is None:
                 raise Exception("Embeddings object is None")
             
-            # Create documents from chunks
-            documents = [Document(page_content=chunk) for chunk in text_chunks]
-            self.log(f"📄 Created {len(documents)} documents for embedding")
+            # Chunks may still be produced while earlier batches are embedding
+            texts, vectors = self.embed_chunks(text_chunks)
+            if not texts:
+                raise Exception("No text chunks to embed")
             
-            # Create vector store with retry logic
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    self.log(f"🔄 Attempt {attempt + 1}/{max_retries} to create vector store...")
-                    if attempt == 0:
-                        self.log("🧪 Testing embeddings with single document...")
-                        test_embedding = self.embeddings.embed_documents([documents[0].page_content])
-                        self.log(f"✅ Test embedding successful, length: {len(test_embedding[0])}")
-                    
-                    self.vector_store = FAISS.from_documents(documents, self.embeddings)
-                    self.log("✅ FAISS vector store created successfully")
-                    break
-                    
-                except Exception as e:
-                    self.log(f"⚠️ Attempt {attempt + 1} failed: {e}")
-                    if attempt == max_retries - 1:
-                        raise e
-                    self.log("🔄 Retrying in 3 seconds...")
-                    import time
-                    time.sleep(3)
-
-            temp_dir = tempfile.mkdtemp()
-            self.vector_store_path = os.path.join(temp_dir, "faiss_index")
-            self.vector_store.save_local(self.vector_store_path)
+            # The store is queried once per run, so a flat index is the fastest option
+            text_embeddings: List[Tuple[str, List[float]]] = list(zip(texts, vectors))
+            self.vector_store = FAISS.from_embeddings(
+                text_embeddings=text_embeddings,
+                embedding=self.embeddings
+            )
+            self.log("✅ FAISS vector store created successfully")
             
-            self.log(f"✅ Vector store created with {len(text_chunks)} embeddings")
+            self.log(f"✅ Vector store created with {len(texts)} embeddings")
             return True
             
         except Exception as e:
@@ -192,8 +480,9 @@ class AdvancedReadmeGenerator:
             self.log(f"❌ Full traceback: {traceback.format_exc()}")
             return False
     
-    def get_conversational_chain(self):
-        """Create the conversational chain for README generation"""
+    def get_readme_prompt(self):
+        """Create the prompt template for README generation"""
+        from langchain.prompts import PromptTemplate
         
         readme_prompt_template = """
 You are an expert software developer and technical writer. Based on the provided codebase context, generate a comprehensive and professional README.md file.
@@ -233,13 +522,7 @@ Analyze the code context carefully and create a README that includes:
             input_variables=["context", "question"]
         )
         
-        chain = load_qa_chain(
-            self.chat_model, 
-            chain_type="stuff", 
-            prompt=prompt
-        )
-        
-        return chain
+        return prompt
     
     def analyze_codebase_with_rag(self, user_question: str) -> str:
         """Use RAG to analyze codebase and generate README content"""
@@ -249,26 +532,40 @@ Analyze the code context carefully and create a README that includes:
             
             self.log("🔍 Searching for relevant code context...")
             
-            # Search for relevant documents
-            relevant_docs = self.vector_store.similarity_search(
-                user_question, 
-                k=10  # Get top 10 most relevant chunks
+            # Embed the question once and reuse the vector for later PDFs
+            if user_question not in self.query_embeddings:
+                self.query_embeddings[user_question] = self.embeddings.embed_query(user_question)
+            question_vector = self.query_embeddings[user_question]
+            
+            # Search for relevant documents, using MMR to avoid near-duplicate chunks
+            relevant_docs = self.vector_store.max_marginal_relevance_search_by_vector(
+                question_vector, 
+                k=10,  # Get top 10 most relevant chunks
+                fetch_k=30,  # Candidate pool to diversify from
+                lambda_mult=0.5
             )
             
             self.log(f"📄 Found {len(relevant_docs)} relevant code sections")
             
-            # Get conversational chain
-            chain = self.get_conversational_chain()
+            # Stuff the retrieved chunks into the prompt
+            context = "\n\n".join(doc.page_content for doc in relevant_docs)
+            prompt_text = self.get_readme_prompt().format(context=context, question=user_question)
             
             self.log("🤖 Generating README content with RAG...")
             
-            # Generate response
-            response = chain(
-                {"input_documents": relevant_docs, "question": user_question},
-                return_only_outputs=True
-            )
-            
-            readme_content = response["output_text"].strip()
+            # Generate response, streaming the formatted README to stdout when requested;
+            # the streamed text matches post_process_readme() of the full response
+            if self.stream_output:
+                formatter = _ReadmeStreamFormatter(self.post_process_readme)
+                for chunk in self.chat_model.stream(prompt_text):
+                    sys.stdout.write(formatter.feed(chunk.content))
+                    sys.stdout.flush()
+                readme_content = formatter.raw.strip()
+                if readme_content:
+                    sys.stdout.write(formatter.finish() + "\n")
+                    sys.stdout.flush()
+            else:
+                readme_content = self.chat_model.invoke(prompt_text).content.strip()
             
             if not readme_content:
                 raise Exception("Empty response from RAG chain")
@@ -280,25 +577,21 @@ Analyze the code context carefully and create a README that includes:
             raise Exception(f"Failed to analyze codebase with RAG: {str(e)}")
     
     def cleanup(self):
-        """Clean up temporary files and vector store"""
-        try:
-            if hasattr(self, 'vector_store_path') and os.path.exists(self.vector_store_path):
-                import shutil
-                shutil.rmtree(os.path.dirname(self.vector_store_path))
-                self.log("Cleaned up temporary vector store")
-        except Exception as e:
-            self.log(f"Warning: Could not clean up temporary files: {e}")
+        """Release the in-memory vector store"""
+        # The index is never written to disk, so dropping the reference is enough
+        self.vector_store = None
     
-    def process_pdf(self, pdf_path: str) -> Dict[str, Any]:
+    def process_pdf(self, pdf_path: str, question: Optional[str] = None) -> Dict[str, Any]:
         """Main method to process PDF and generate README using RAG"""
         try:
             self.log(f"Processing PDF with RAG: {pdf_path}")
             
             pdf_content = self.extract_text_from_pdf(pdf_path)
 
-            text_chunks = self.get_text_chunks(pdf_content)
-            if not self.create_vector_store(text_chunks):
+            # Chunks are split lazily and embedded as they become available
+            if not self.create_vector_store(self.iter_text_chunks(pdf_content)):
                 raise Exception("Failed to create vector store")
+            chunks_created = len(self.vector_store.index_to_docstore_id)
             
             readme_question = """
             Analyze this codebase comprehensively and generate a detailed README.md file. 
@@ -341,7 +634,7 @@ Analyze the code context carefully and create a README that includes:
             """
             
             # Step 5: Generate README using RAG
-            readme_content = self.analyze_codebase_with_rag(readme_question)
+            readme_content = self.analyze_codebase_with_rag(question or readme_question)
             
             # Step 6: Post-process the content to ensure it's well-formatted
             readme_content = self.post_process_readme(readme_content)
@@ -352,7 +645,7 @@ Analyze the code context carefully and create a README that includes:
                 "message": "README generated successfully using RAG analysis",
                 "stats": {
                     "pdf_text_length": len(pdf_content),
-                    "chunks_created": len(text_chunks),
+                    "chunks_created": chunks_created,
                     "readme_length": len(readme_content)
                 }
             }
@@ -366,7 +659,7 @@ Analyze the code context carefully and create a README that includes:
                 "message": error_msg
             }
         finally:
-            # Always cleanup temporary files
+            # Always release the vector store
             self.cleanup()
     
     def post_process_readme(self, content: str) -> str:
@@ -380,40 +673,68 @@ Analyze the code context carefully and create a README that includes:
             content = f"# {first_line}\n\n" + content
         
         # Ensure proper spacing around headers
-        content = re.sub(r'\n(#{1,6})\s*([^\n]+)\n', r'\n\n\1 \2\n\n', content)
+        content = _HEADER_RE.sub(r'\n\n\1 \2\n\n', content)
         
         # Clean up multiple consecutive newlines
-        content = re.sub(r'\n{3,}', '\n\n', content)
+        content = _MULTINL_RE.sub('\n\n', content)
         
         # Ensure code blocks are properly formatted
-        content = re.sub(r'```(\w+)?\n(.*?)\n```', r'```\1\n\2\n```', content, flags=re.DOTALL)
+        content = _CODEBLOCK_RE.sub(r'```\1\n\2\n```', content)
         
         return content.strip()
 
 def main():
     """Main function to handle command line execution"""
     parser = argparse.ArgumentParser(description='Generate README from PDF using RAG analysis')
-    parser.add_argument('pdf_path', help='Path to the PDF file containing codebase summary')
+    parser.add_argument('pdf_path', nargs='?', help='Path to the PDF file containing codebase summary')
     parser.add_argument('--json', action='store_true', help='Output result as JSON')
     parser.add_argument('--output', '-o', help='Output file path for README content')
     parser.add_argument('--question', help='Custom question for README generation')
     parser.add_argument('--clean', action='store_true', help='Output only the README content without logs')
     parser.add_argument('--verbose', '-v', action='store_true', help='Show detailed processing logs')
+    parser.add_argument('--stdin-loop', action='store_true', help='Read PDF paths from stdin, one per line, and print one JSON result per line')
     
     args = parser.parse_args()
+    if not args.pdf_path and not args.stdin_loop:
+        parser.error('pdf_path is required unless --stdin-loop is set')
+    if args.stdin_loop:
+        # PDF paths come from stdin and results are always JSON lines on stdout
+        if args.pdf_path:
+            parser.error('pdf_path cannot be combined with --stdin-loop; pass paths on stdin')
+        if args.json:
+            parser.error('--json cannot be combined with --stdin-loop; results are already JSON')
+        if args.output:
+            parser.error('--output cannot be combined with --stdin-loop; results go to stdout')
     
     try:
         # Determine verbose mode - only verbose if explicitly requested or not in clean mode
         verbose_mode = args.verbose and not args.clean
         
+        if args.stdin_loop:
+            # Reuse one generator (and its Gemini clients) for every PDF path;
+            # logs go to stderr so stdout carries only the JSON results
+            generator = AdvancedReadmeGenerator(verbose=verbose_mode, log_to_stderr=True)
+            for line in sys.stdin:
+                pdf_path = line.strip()
+                if not pdf_path:
+                    continue
+                result = generator.process_pdf(pdf_path, args.question)
+                if args.clean and "stats" in result:
+                    del result["stats"]
+                print(json.dumps(result), flush=True)
+            return
+        
         if not args.json and not args.clean:
             print(f"🚀 Starting README generation for: {args.pdf_path}")
         
+        # Stream the README as it is generated in clean mode; JSON output stays buffered
+        stream_mode = args.clean and not args.json
+        
         # Create generator instance with appropriate verbosity
-        generator = AdvancedReadmeGenerator(verbose=verbose_mode)
+        generator = AdvancedReadmeGenerator(verbose=verbose_mode, stream_output=stream_mode)
         
         # Process the PDF
-        result = generator.process_pdf(args.pdf_path)
+        result = generator.process_pdf(args.pdf_path, args.question)
         
         if args.json:
             # Output as JSON (for VS Code extension) - but remove stats if clean mode
@@ -421,10 +742,8 @@ def main():
                 del result["stats"]
             print(json.dumps(result, indent=2))
         elif args.clean:
-            # Clean output mode - only README content
-            if result["success"]:
-                print(result["content"])
-            else:
+            # Clean output mode - README content was already streamed to stdout
+            if not result["success"]:
                 print(f"Error: {result['message']}", file=sys.stderr)
                 sys.exit(1)
         else:
@@ -434,7 +753,7 @@ def main():
                 
                 if "stats" in result:
                     stats = result["stats"]
-                    print(f"📊 Processing stats:")
+                    print("📊 Processing stats:")
                     print(f"   - PDF text: {stats['pdf_text_length']:,} characters")
                     print(f"   - Text chunks: {stats['chunks_created']}")
                     print(f"   - README: {stats['readme_length']:,} characters")
@@ -459,7 +778,10 @@ def main():
             "message": f"Script error: {str(e)}"
         }
         
-        if args.json:
+        if args.stdin_loop:
+            # Keep one JSON object per line for the reading process
+            print(json.dumps(error_result), flush=True)
+        elif args.json:
             if args.clean and "stats" in error_result:
                 del error_result["stats"]
             print(json.dumps(error_result, indent=2))
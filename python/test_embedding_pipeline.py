@@ -0,0 +1,136 @@
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import app
+
+
+class FakeGenerator(app.AdvancedReadmeGenerator):
+    """Generator with a fake embedder, so no API key or network is needed"""
+
+    def __init__(self, fail_on=None):
+        self.verbose = False
+        self.fail_on = fail_on
+        self.calls = []
+
+    async def _embed_with_retry(self, batch):
+        self.calls.append(list(batch))
+        await asyncio.sleep(0.01)
+        if self.fail_on in batch:
+            raise RuntimeError("embedding failed")
+        return [[float(len(text)), float(ord(text[-1]))] for text in batch]
+
+
+def expected_vector(text):
+    return [float(len(text)), float(ord(text[-1]))]
+
+
+def with_settings(test):
+    """Run a test against a fresh cache dir with small batches"""
+    def run():
+        saved = app.EMBEDDING_CACHE_DIR, app.EMBEDDING_BATCH_SIZE, app.EMBEDDING_CONCURRENCY
+        with tempfile.TemporaryDirectory() as cache_dir:
+            app.EMBEDDING_CACHE_DIR = Path(cache_dir)
+            app.EMBEDDING_BATCH_SIZE = 3
+            app.EMBEDDING_CONCURRENCY = 2
+            try:
+                test()
+            finally:
+                app.EMBEDDING_CACHE_DIR, app.EMBEDDING_BATCH_SIZE, app.EMBEDDING_CONCURRENCY = saved
+    run.__name__ = test.__name__
+    return run
+
+
+@with_settings
+def test_vectors_follow_text_order():
+    chunks = [f"chunk {i}" for i in range(10)]
+    texts, vectors = FakeGenerator().embed_chunks(iter(chunks))
+    assert texts == chunks
+    assert vectors == [expected_vector(text) for text in chunks]
+
+
+@with_settings
+def test_duplicates_are_embedded_once():
+    generator = FakeGenerator()
+    chunks = ["a", "bb", "a", "ccc", "bb", "a"]
+    texts, vectors = generator.embed_chunks(chunks)
+    assert texts == chunks
+    assert vectors == [expected_vector(text) for text in chunks]
+    assert sorted(text for batch in generator.calls for text in batch) == ["a", "bb", "ccc"]
+
+
+@with_settings
+def test_second_run_reuses_cache():
+    FakeGenerator().embed_chunks(["a", "bb", "ccc"])
+    generator = FakeGenerator()
+    texts, vectors = generator.embed_chunks(["a", "bb", "ccc", "dddd"])
+    assert generator.calls == [["dddd"]]
+    assert vectors == [expected_vector(text) for text in texts]
+
+
+@with_settings
+def test_failed_batch_stops_dispatch():
+    produced = []
+
+    def slow_chunks():
+        for i in range(200):
+            time.sleep(0.005)
+            produced.append(i)
+            yield f"c{i}"
+
+    generator = FakeGenerator(fail_on="c5")
+    try:
+        generator.embed_chunks(slow_chunks())
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("expected the failed batch to raise")
+    assert len(generator.calls) < 10, generator.calls
+    assert len(produced) < 200, len(produced)
+
+    # Batches that succeeded before the failure stay cached
+    retry = FakeGenerator()
+    retry.embed_chunks(["c0", "c1", "c2"])
+    assert retry.calls == []
+
+
+@with_settings
+def test_splitter_error_is_raised_without_trailing_batch():
+    def broken_chunks():
+        yield "a"
+        yield "b"
+        raise ValueError("split failed")
+
+    generator = FakeGenerator()
+    try:
+        generator.embed_chunks(broken_chunks())
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected the splitter error to propagate")
+    assert generator.calls == []
+
+
+TESTS = [
+    test_vectors_follow_text_order,
+    test_duplicates_are_embedded_once,
+    test_second_run_reuses_cache,
+    test_failed_batch_stops_dispatch,
+    test_splitter_error_is_raised_without_trailing_batch,
+]
+
+
+def main():
+    for test in TESTS:
+        try:
+            test()
+        except AssertionError as e:
+            print(f"❌ {test.__name__} failed: {e}")
+            sys.exit(1)
+        print(f"✅ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import random
+import sys
+
+from app import AdvancedReadmeGenerator, _ReadmeStreamFormatter
+
+# post_process_readme doesn't touch instance state, so no API key is needed
+post_process = AdvancedReadmeGenerator.post_process_readme.__get__(object())
+
+PIECES = [
+    "\n", "\n\n", "\n\n\n", "  \n", "\r", "\t", " ", "-",
+    "#", "##", "# ", "#x", "## A\n", "\n#\n",
+    "Title", "text", "x\n", "```", "```py\ncode\n```",
+]
+
+
+def stream(raw: str, rng: random.Random) -> str:
+    """Feed raw text in random-sized chunks, checking every emitted prefix"""
+    expected = post_process(raw.strip())
+    formatter = _ReadmeStreamFormatter(post_process)
+    output = ""
+    position = 0
+    while position < len(raw):
+        size = rng.randint(1, 6)
+        output += formatter.feed(raw[position:position + size])
+        position += size
+        assert expected.startswith(output), (raw, output, expected)
+    return output + formatter.finish()
+
+
+def test_streamed_output_matches_post_processing():
+    rng = random.Random(0)
+    for _ in range(20000):
+        raw = "".join(rng.choice(PIECES) for _ in range(rng.randint(1, 30)))
+        if not raw.strip():
+            continue
+        assert stream(raw, rng) == post_process(raw.strip()), raw
+
+
+def test_text_is_emitted_before_the_stream_ends():
+    formatter = _ReadmeStreamFormatter(post_process)
+    raw = "My Project\n\nIntro text.\n## Install\nrun it\n\nMore words\n\n" * 3
+    early = "".join(formatter.feed(raw[i:i + 7]) for i in range(0, len(raw), 7))
+    assert early.startswith("# My Project\n\nMy Project\n\nIntro text.\n\n## Install\n\n")
+    assert early + formatter.finish() == post_process(raw.strip())
+
+
+def main():
+    try:
+        test_streamed_output_matches_post_processing()
+        test_text_is_emitted_before_the_stream_ends()
+    except AssertionError as e:
+        print(f"❌ Streamed README differs from post_process_readme(): {e}")
+        sys.exit(1)
+    print("✅ Streamed README output matches post_process_readme()")
+
+
+if __name__ == "__main__":
+    main()